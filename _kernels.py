@@ -0,0 +1,55 @@
+"""Compiled per-type kernels for batch processing of trainings.
+
+Numba is optional: without it the kernels stay plain Python loops
+and `NUMBA_AVAILABLE` is False, so callers should prefer numpy.
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Leave the function as is when numba is not installed."""
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def running_calories(action, duration, weight,
+                     len_step, m_in_km, multiplier, bias, minutes_in_hour,
+                     distance, speed, calories):
+    """Fill distance, speed and calories for running trainings."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * len_step / m_in_km
+        speed[i] = distance[i] / duration[i]
+        calories[i] = ((multiplier * speed[i] - bias)
+                       * weight[i] / m_in_km
+                       * duration[i] * minutes_in_hour)
+
+
+@njit(parallel=True, cache=True)
+def walking_calories(action, duration, weight, height,
+                     len_step, m_in_km, multiplier, bias, minutes_in_hour,
+                     distance, speed, calories):
+    """Fill distance, speed and calories for sport walking trainings."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * len_step / m_in_km
+        speed[i] = distance[i] / duration[i]
+        calories[i] = ((multiplier * weight[i]
+                       + (speed[i] * speed[i] // height[i])
+                       * bias * weight[i])
+                       * duration[i] * minutes_in_hour)
+
+
+@njit(parallel=True, cache=True)
+def swimming_calories(action, duration, weight, length_pool, count_pool,
+                      len_step, m_in_km, multiplier, bias,
+                      distance, speed, calories):
+    """Fill distance, speed and calories for swimming trainings."""
+    for i in prange(action.shape[0]):
+        distance[i] = action[i] * len_step / m_in_km
+        speed[i] = ((length_pool[i] * count_pool[i])
+                    / m_in_km / duration[i])
+        calories[i] = ((speed[i] + multiplier)
+                       * bias * weight[i])
@@ -1,25 +1,55 @@
-from typing import Dict, Tuple, List, Union, Type
-from dataclasses import dataclass, asdict
+import inspect
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional, Union, Type
+from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+KERNEL_MIN_BATCH: int = 10_000
+MESSAGE_CACHE_SIZE: int = 4096
+
+
+def _format_message(training_type: str,
+                    duration: float,
+                    distance: float,
+                    speed: float,
+                    calories: float) -> str:
+    """Format message about training."""
+    return (f'Тип тренировки: {training_type}; '
+            f'Длительность: {duration:.3f} ч.; '
+            f'Дистанция: {distance:.3f} км; '
+            f'Ср. скорость: {speed:.3f} км/ч; '
+            f'Потрачено ккал: {calories:.3f}.')
+
+
+_render_message = lru_cache(maxsize=MESSAGE_CACHE_SIZE)(_format_message)
+
+
+@dataclass(frozen=True)
 class InfoMessage:
     """Information message about training."""
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
     training_type: str
     duration: float
     distance: float
     speed: float
     calories: float
-    MSG_BODY: str = ('Тип тренировки: {training_type:}; '
-                     'Длительность: {duration:.3f} ч.; '
-                     'Дистанция: {distance:.3f} км; '
-                     'Ср. скорость: {speed:.3f} км/ч; '
-                     'Потрачено ккал: {calories:.3f}.')
 
     def get_message(self) -> str:
-        """Get sketched message."""
-        return self.MSG_BODY.format(**asdict(self))
+        """Get sketched message.
+
+        Messages are cached by field values. Zero values skip the cache
+        as 0.0 and -0.0 are equal keys but are formatted differently.
+        """
+        if self.duration and self.distance and self.speed and self.calories:
+            return _render_message(self.training_type, self.duration,
+                                   self.distance, self.speed, self.calories)
+        return _format_message(self.training_type, self.duration,
+                               self.distance, self.speed, self.calories)
 
 
 class Training:
@@ -35,8 +65,17 @@ class Training:
         Weight of sportsman in kg.
     """
 
+    TRAINING_TYPE: str = 'Training'
     M_IN_KM: float = 1000.0
     LEN_STEP: float = .65
+    MINUTES_IN_HOUR: int = 60
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Name training type after the subclass unless it declares one."""
+        super().__init_subclass__(**kwargs)
+        if 'TRAINING_TYPE' not in cls.__dict__:
+            cls.TRAINING_TYPE = cls.__name__
+        cls._bind_hooks()
 
     def __init__(self,
                  action: int,
@@ -53,19 +92,67 @@ class Training:
 
     def get_mean_speed(self) -> float:
         """Get mean speed in km/hr."""
-        return self.get_distance() / self.duration
+        return self._speed_from(self.get_distance())
 
     def get_spent_calories(self) -> float:
         """Get spent calories."""
         raise NotImplementedError()
 
+    def _speed_from(self, distance: float) -> float:
+        """Get mean speed in km/hr from already evaluated distance."""
+        return distance / self.duration
+
+    def _calories_from(self, mean_speed: float) -> float:
+        """Get spent calories from already evaluated mean speed."""
+        raise NotImplementedError()
+
+    @classmethod
+    def _bind_hooks(cls) -> None:
+        """Remember getters that `_speed_from`/`_calories_from` replace.
+
+        A getter is replaced only when it is not overridden
+        below the class that defines its hook.
+        """
+        for getter, hook, attr in (
+            ('get_mean_speed', '_speed_from', '_SPEED_GETTER'),
+            ('get_spent_calories', '_calories_from', '_CALORIES_GETTER'),
+        ):
+            hooked: object = None
+            for klass in cls.__mro__:
+                if hook in klass.__dict__:
+                    hooked = getattr(cls, getter)
+                    break
+                if getter in klass.__dict__:
+                    break
+            setattr(cls, attr, hooked)
+
     def show_training_info(self) -> InfoMessage:
-        """Show message about training."""
-        return InfoMessage(type(self).__name__,
+        """Show message about training.
+
+        Overridden `get_mean_speed` and `get_spent_calories`
+        take precedence over `_speed_from` and `_calories_from`.
+        """
+        distance: float = self.get_distance()
+        overrides: Dict[str, object] = self.__dict__
+        cls: Type[Training] = type(self)
+        if (cls.get_mean_speed is cls._SPEED_GETTER
+                and 'get_mean_speed' not in overrides):
+            speed: float = self._speed_from(distance)
+        else:
+            speed = self.get_mean_speed()
+        if (cls.get_spent_calories is cls._CALORIES_GETTER
+                and 'get_spent_calories' not in overrides):
+            calories: float = self._calories_from(speed)
+        else:
+            calories = self.get_spent_calories()
+        return InfoMessage(self.TRAINING_TYPE,
                            self.duration,
-                           self.get_distance(),
-                           self.get_mean_speed(),
-                           self.get_spent_calories())
+                           distance,
+                           speed,
+                           calories)
+
+
+Training._bind_hooks()
 
 
 class Running(Training):
@@ -74,7 +161,6 @@ class Running(Training):
     LEN_STEP = .65
     CALORIE_MULTIPLIER: int = 18
     CALORIE_BIAS: int = 20
-    MINUTES_IN_HOUR: int = 60
 
     def __init__(self,
                  action: int,
@@ -84,7 +170,11 @@ class Running(Training):
 
     def get_spent_calories(self) -> float:
         """Evaluate with special running coefficients."""
-        return ((self.CALORIE_MULTIPLIER * self.get_mean_speed()
+        return self._calories_from(self.get_mean_speed())
+
+    def _calories_from(self, mean_speed: float) -> float:
+        """Evaluate running calories from mean speed."""
+        return ((self.CALORIE_MULTIPLIER * mean_speed
                 - self.CALORIE_BIAS)
                 * self.weight / self.M_IN_KM
                 * self.duration * self.MINUTES_IN_HOUR)
@@ -96,7 +186,6 @@ class SportsWalking(Training):
     LEN_STEP = .65
     CALORIE_MULTIPLIER: float = .035
     CALORIE_BIAS: float = .029
-    MINUTES_IN_HOUR: int = 60
 
     def __init__(self,
                  action: int,
@@ -108,15 +197,23 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Evaluate with special sport walking coefficients."""
-        return ((self.CALORIE_MULTIPLIER * self.weight
-                + (self.get_mean_speed() ** 2 // self.height)
-                * self.CALORIE_BIAS * self.weight)
+        return self._calories_from(self.get_mean_speed())
+
+    def _calories_from(self, mean_speed: float) -> float:
+        """Evaluate sport walking calories from mean speed."""
+        weight: float = self.weight
+        return ((self.CALORIE_MULTIPLIER * weight
+                + (mean_speed * mean_speed // self.height)
+                * self.CALORIE_BIAS * weight)
                 * self.duration * self.MINUTES_IN_HOUR)
 
 
 class Swimming(Training):
     """Training: swimming.
 
+    Distance is counted by strokes (`action` * `LEN_STEP`),
+    mean speed is evaluated with pool parameters.
+
     Parameters
     ----------
     length_pool : float
@@ -141,30 +238,170 @@ class Swimming(Training):
 
     def get_spent_calories(self) -> float:
         """Evaluate calories for swimming training type."""
-        return ((self.get_mean_speed() + self.CALORIE_MULTIPLIER)
+        return self._calories_from(self.get_mean_speed())
+
+    def _calories_from(self, mean_speed: float) -> float:
+        """Evaluate swimming calories from mean speed."""
+        return ((mean_speed + self.CALORIE_MULTIPLIER)
                 * self.CALORIE_BIAS * self.weight)
 
     def get_mean_speed(self) -> float:
         """Evaluate mean speed with pool parameters."""
+        return self._pool_speed()
+
+    def _speed_from(self, distance: float) -> float:
+        """Evaluate mean speed with pool parameters, ignoring distance."""
+        return self._pool_speed()
+
+    def _pool_speed(self) -> float:
+        """Evaluate mean speed in km/hr from pool length and count."""
         return ((self.length_pool * self.count_pool)
                 / self.M_IN_KM / self.duration)
 
 
+WORKOUTS: Dict[str, Type[Training]] = dict(SWM=Swimming,
+                                           RUN=Running,
+                                           WLK=SportsWalking)
+
+
 def read_package(workout_type: str, data: list) -> Union[Training, ValueError]:
     """Read the data received from the sensors."""
-    workouts: Dict[str, Type[Training]] = dict(SWM=Swimming,
-                                               RUN=Running,
-                                               WLK=SportsWalking)
-    if workout_type in workouts:
-        return workouts[workout_type](*data)
+    try:
+        workout: Type[Training] = WORKOUTS[workout_type]
+    except KeyError:
+        raise ValueError from None
+    return workout(*data)
+
+
+def compute_batch(workout_type: str,
+                  data_cols: Dict[str, 'np.ndarray'],
+                  ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Evaluate distance, mean speed and calories for many trainings.
+
+    Vectorized counterpart of `show_training_info` for trainings
+    of the same type. `data_cols` maps the training `__init__`
+    parameter names to equally sized arrays. A zero duration
+    raises ZeroDivisionError as in the per-object path.
+    """
+    import numpy as np
+
+    try:
+        workout: Type[Training] = WORKOUTS[workout_type]
+    except KeyError:
+        raise ValueError from None
+    cols: Dict[str, np.ndarray] = {
+        name: np.asarray(col, dtype=np.float64)
+        for name, col in data_cols.items()
+    }
+    if not cols['duration'].all():
+        raise ZeroDivisionError('float division by zero')
+    if cols['action'].size >= KERNEL_MIN_BATCH:
+        import _kernels
+
+        if _kernels.NUMBA_AVAILABLE:
+            return _compute_kernel(workout, cols)
+    duration: np.ndarray = cols['duration']
+    weight: np.ndarray = cols['weight']
+    distance: np.ndarray = (cols['action'] * workout.LEN_STEP
+                            / workout.M_IN_KM)
+    if workout is Swimming:
+        speed: np.ndarray = ((cols['length_pool'] * cols['count_pool'])
+                             / workout.M_IN_KM / duration)
+        calories: np.ndarray = ((speed + workout.CALORIE_MULTIPLIER)
+                                * workout.CALORIE_BIAS * weight)
+    elif workout is SportsWalking:
+        speed = distance / duration
+        calories = ((workout.CALORIE_MULTIPLIER * weight
+                    + np.floor_divide(speed * speed, cols['height'])
+                    * workout.CALORIE_BIAS * weight)
+                    * duration * workout.MINUTES_IN_HOUR)
+    elif workout is Running:
+        speed = distance / duration
+        calories = ((workout.CALORIE_MULTIPLIER * speed
+                    - workout.CALORIE_BIAS)
+                    * weight / workout.M_IN_KM
+                    * duration * workout.MINUTES_IN_HOUR)
     else:
-        raise ValueError
+        raise NotImplementedError()
+    return distance, speed, calories
+
+
+def _compute_kernel(workout: Type[Training],
+                    cols: Dict[str, 'np.ndarray'],
+                    ) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Evaluate batch with compiled kernels for large sizes."""
+    import numpy as np
+
+    import _kernels
+
+    distance: np.ndarray = np.empty_like(cols['action'])
+    speed: np.ndarray = np.empty_like(distance)
+    calories: np.ndarray = np.empty_like(distance)
+    if workout is Swimming:
+        _kernels.swimming_calories(
+            cols['action'], cols['duration'], cols['weight'],
+            cols['length_pool'], cols['count_pool'],
+            workout.LEN_STEP, workout.M_IN_KM,
+            workout.CALORIE_MULTIPLIER, workout.CALORIE_BIAS,
+            distance, speed, calories)
+    elif workout is SportsWalking:
+        _kernels.walking_calories(
+            cols['action'], cols['duration'], cols['weight'], cols['height'],
+            workout.LEN_STEP, workout.M_IN_KM,
+            workout.CALORIE_MULTIPLIER, workout.CALORIE_BIAS,
+            float(workout.MINUTES_IN_HOUR),
+            distance, speed, calories)
+    elif workout is Running:
+        _kernels.running_calories(
+            cols['action'], cols['duration'], cols['weight'],
+            workout.LEN_STEP, workout.M_IN_KM,
+            float(workout.CALORIE_MULTIPLIER), float(workout.CALORIE_BIAS),
+            float(workout.MINUTES_IN_HOUR),
+            distance, speed, calories)
+    else:
+        raise NotImplementedError()
+    return distance, speed, calories
 
 
-def main(training: Training) -> None:
+def show_batch_info(packages: List[Tuple[str, List[int]]],
+                    ) -> List[InfoMessage]:
+    """Show messages about many trainings received from the sensors."""
+    import numpy as np
+
+    types: np.ndarray = np.array([workout_type
+                                  for workout_type, _ in packages])
+    if not np.isin(types, list(WORKOUTS)).all():
+        raise ValueError
+    messages: List[Optional[InfoMessage]] = [None] * len(packages)
+    for workout_type, workout in WORKOUTS.items():
+        indexes: np.ndarray = np.flatnonzero(types == workout_type)
+        if not indexes.size:
+            continue
+        names = inspect.signature(workout).parameters
+        for i in indexes.tolist():
+            if len(packages[i][1]) != len(names):
+                raise TypeError(
+                    f'{workout.__name__} takes {len(names)} arguments '
+                    f'but {len(packages[i][1])} were given')
+        rows: np.ndarray = np.array([packages[i][1] for i in indexes],
+                                    dtype=np.float64)
+        data_cols: Dict[str, np.ndarray] = dict(zip(names, rows.T))
+        distance, speed, calories = compute_batch(workout_type, data_cols)
+        for i, values in zip(indexes.tolist(),
+                             zip(data_cols['duration'].tolist(),
+                                 distance.tolist(),
+                                 speed.tolist(),
+                                 calories.tolist())):
+            messages[i] = InfoMessage(workout.TRAINING_TYPE, *values)
+    return messages
+
+
+def main(*trainings: Training) -> None:
     """Main function."""
-    info: InfoMessage = training.show_training_info()
-    print(info.get_message())
+    sys.stdout.write(''.join(
+        training.show_training_info().get_message() + '\n'
+        for training in trainings
+    ))
 
 
 if __name__ == '__main__':
@@ -174,6 +411,5 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training: Training = read_package(workout_type, data)
-        main(training)
+    main(*(read_package(workout_type, data)
+           for workout_type, data in packages))
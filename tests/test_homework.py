@@ -102,6 +102,32 @@ def test_InfoMessage_get_message(input_data, expected):
     )
 
 
+def test_InfoMessage_get_message_cached():
+    info_message = homework.InfoMessage('Running', 1.5, 9.75, 6.5, 699.75)
+    expected = info_message.get_message()
+    hits = homework._render_message.cache_info().hits
+    result = info_message.get_message()
+    assert homework._render_message.cache_info().hits == hits + 1, (
+        'Повторный вызов `get_message` должен брать строку из кэша.'
+    )
+    assert result == expected, (
+        'Повторные вызовы `get_message` должны возвращать ту же строку.'
+    )
+
+
+def test_InfoMessage_get_message_zero_sign():
+    messages = [
+        homework.InfoMessage('Running', 1, 1, 1, calories).get_message()
+        for calories in (0.0, -0.0)
+    ]
+    assert messages[0].endswith('Потрачено ккал: 0.000.'), (
+        'Проверьте форматирование нулевых калорий.'
+    )
+    assert messages[1].endswith('Потрачено ккал: -0.000.'), (
+        'Проверьте форматирование отрицательного нуля калорий.'
+    )
+
+
 def test_Training():
     assert inspect.isclass(homework.Training), (
         'Проверьте, что `Training` - это класс.'
@@ -205,6 +231,101 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+@pytest.mark.parametrize('input_data, expected', [
+    (['SWM', [720, 1, 80, 25, 40]], 'Swimming'),
+    (['RUN', [1206, 12, 6]], 'Running'),
+    (['WLK', [9000, 1, 75, 180]], 'SportsWalking'),
+])
+def test_show_training_info_values(input_data, expected):
+    training = homework.read_package(*input_data)
+    result = training.show_training_info()
+    assert result.training_type == expected, (
+        'Метод `show_training_info` должен передавать в `InfoMessage` '
+        'название класса тренировки.'
+    )
+    assert result.distance == training.get_distance(), (
+        'Дистанция в `InfoMessage` должна совпадать с `get_distance`.'
+    )
+    assert result.speed == training.get_mean_speed(), (
+        'Скорость в `InfoMessage` должна совпадать с `get_mean_speed`.'
+    )
+    assert result.calories == training.get_spent_calories(), (
+        'Калории в `InfoMessage` должны совпадать с `get_spent_calories`.'
+    )
+
+
+def test_Training_subclass_without_calories_hook():
+    class Cycling(homework.Training):
+        def get_spent_calories(self):
+            return self.get_mean_speed() * self.weight
+
+    class Rowing(homework.Training):
+        def get_spent_calories(self):
+            return self._calories_from(self.get_mean_speed())
+
+    result = Cycling(9000, 1, 75).show_training_info()
+    assert result.calories == 438.75, (
+        'Метод `show_training_info` должен использовать '
+        '`get_spent_calories` подкласса.'
+    )
+    with pytest.raises(NotImplementedError):
+        Rowing(9000, 1, 75).show_training_info()
+
+
+def test_show_training_info_getter_overrides(monkeypatch):
+    class FixedRunning(homework.Running):
+        def get_spent_calories(self):
+            return 42.0
+
+    class FastSwimming(homework.Swimming):
+        def get_mean_speed(self):
+            return 7.0
+
+    result = FixedRunning(9000, 1, 75).show_training_info()
+    assert result.calories == 42.0, (
+        'Метод `show_training_info` должен использовать '
+        'переопределённый `get_spent_calories`.'
+    )
+    running = homework.Running(9000, 1, 75)
+    monkeypatch.setattr(running, 'get_spent_calories', lambda: 1.0)
+    result = running.show_training_info()
+    assert result.calories == 1.0, (
+        'Метод `show_training_info` должен использовать '
+        '`get_spent_calories` экземпляра.'
+    )
+    swimming = FastSwimming(720, 1, 80, 25, 40)
+    result = swimming.show_training_info()
+    assert result.speed == 7.0, (
+        'Метод `show_training_info` должен использовать '
+        'переопределённый `get_mean_speed`.'
+    )
+    assert result.calories == swimming.get_spent_calories(), (
+        'Калории должны считаться по переопределённой скорости.'
+    )
+
+
+def test_Training_subclass_training_type():
+    class Trail(homework.Running):
+        pass
+
+    result = Trail(9000, 1, 75).show_training_info()
+    assert result.training_type == 'Trail', (
+        'Тип тренировки в `InfoMessage` должен совпадать '
+        'с названием класса тренировки.'
+    )
+
+
+def test_Training_subclass_declared_training_type():
+    class Hike(homework.SportsWalking):
+        TRAINING_TYPE = 'Mountain hike'
+
+    result = Hike(9000, 1, 75, 180).show_training_info()
+    assert result.training_type == 'Mountain hike', (
+        'Объявленный в классе `TRAINING_TYPE` должен '
+        'использоваться в `InfoMessage`.'
+    )
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -323,6 +444,74 @@ def test_Running_get_spent_calories(input_data, expected):
     )
 
 
+def test_show_batch_info():
+    pytest.importorskip('numpy')
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [15000, 1, 75]),
+        ('SWM', [1206, 12, 6, 12, 6]),
+    ]
+    result = homework.show_batch_info(packages)
+    expected = [
+        homework.read_package(*package).show_training_info()
+        for package in packages
+    ]
+    assert result == expected, (
+        'Функция `show_batch_info` должна возвращать те же сообщения, '
+        'что и `show_training_info` для каждого пакета.'
+    )
+
+
+@pytest.mark.parametrize('package', [
+    ('RUN', [15000, 1, 75, 180]),
+    ('SWM', [720, 1, 80, 25]),
+])
+def test_show_batch_info_wrong_fields(package):
+    pytest.importorskip('numpy')
+    with pytest.raises(TypeError):
+        homework.read_package(*package)
+    with pytest.raises(TypeError):
+        homework.show_batch_info([('WLK', [9000, 1, 75, 180]), package])
+
+
+def test_compute_batch_errors(monkeypatch):
+    pytest.importorskip('numpy')
+    with pytest.raises(ZeroDivisionError):
+        homework.compute_batch(
+            'RUN', dict(action=[15000, 1206], duration=[1, 0], weight=[75, 6])
+        )
+
+    class Cycling(homework.Training):
+        pass
+
+    monkeypatch.setitem(homework.WORKOUTS, 'CYC', Cycling)
+    with pytest.raises(NotImplementedError):
+        homework.compute_batch(
+            'CYC', dict(action=[15000], duration=[1], weight=[75])
+        )
+
+
+@pytest.mark.parametrize('workout_type, data_cols', [
+    ('SWM', dict(action=[720, 1206], duration=[1, 12], weight=[80, 6],
+                 length_pool=[25, 12], count_pool=[40, 6])),
+    ('RUN', dict(action=[15000, 1206], duration=[1, 12], weight=[75, 6])),
+    ('WLK', dict(action=[9000, 420], duration=[1, 4], weight=[75, 20],
+                 height=[180, 42])),
+])
+def test_compute_batch_kernels(monkeypatch, workout_type, data_cols):
+    pytest.importorskip('numba')
+    expected = homework.compute_batch(workout_type, data_cols)
+    monkeypatch.setattr(homework, 'KERNEL_MIN_BATCH', 0)
+    result = homework.compute_batch(workout_type, data_cols)
+    for result_col, expected_col in zip(result, expected):
+        assert result_col.tolist() == expected_col.tolist(), (
+            'Скомпилированные функции должны давать тот же результат, '
+            'что и `compute_batch` на numpy.'
+        )
+
+
 def test_main():
     assert hasattr(homework, 'main'), (
         'Создайте главную функцию программы с именем `main`.'